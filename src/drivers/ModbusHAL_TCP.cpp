@@ -12,6 +12,7 @@
 #include <fcntl.h>
 #include <string.h> // For memset, memcpy
 #include <arpa/inet.h> // For htons, inet_pton
+#include <netinet/tcp.h> // For TCP_NODELAY
 #include "freertos/FreeRTOS.h"
 #include "freertos/task.h"
 #include "freertos/queue.h"
@@ -170,6 +171,20 @@ static uint32_t stringToIP(const char* ip_str) {
     return 0;
 }
 
+// Tune a connected socket for small request/response Modbus frames:
+// TCP_NODELAY disables Nagle so short ADUs are flushed immediately, and
+// SO_KEEPALIVE lets the stack detect half-open connections.
+// Failures are logged but not fatal (socket stays usable with defaults).
+static void configureSocketOptions(int sock) {
+    int opt = 1;
+    if (setsockopt(sock, IPPROTO_TCP, TCP_NODELAY, &opt, sizeof(opt)) < 0) {
+        Modbus::Debug::LOG_MSGF("setsockopt(TCP_NODELAY) failed for socket %d, errno: %d", sock, errno);
+    }
+    if (setsockopt(sock, SOL_SOCKET, SO_KEEPALIVE, &opt, sizeof(opt)) < 0) {
+        Modbus::Debug::LOG_MSGF("setsockopt(SO_KEEPALIVE) failed for socket %d, errno: %d", sock, errno);
+    }
+}
+
 bool TCP::setupClientSocket(const char* serverIP, uint16_t port) {
     
     uint32_t ip_addr = stringToIP(serverIP);
@@ -253,6 +268,8 @@ bool TCP::setupClientSocket(const char* serverIP, uint16_t port) {
     } else {
         Modbus::Debug::LOG_MSGF("Connected to %s:%u immediately!", serverIP, port);
     }
+
+    configureSocketOptions(newSocket);
     
     // Atomic assignment at the end (under Mutex)
     {
@@ -459,6 +476,7 @@ void TCP::runTcpTask() {
                         // Set new socket to non-blocking
                         int flags = fcntl(new_socket, F_GETFL, 0);
                         if (flags != -1 && fcntl(new_socket, F_SETFL, flags | O_NONBLOCK) != -1) {
+                            configureSocketOptions(new_socket);
                             _activeSockets[_activeSocketCount++] = new_socket;
                             char client_ip[INET_ADDRSTRLEN];
                             inet_ntop(AF_INET, &client_addr.sin_addr, client_ip, INET_ADDRSTRLEN);